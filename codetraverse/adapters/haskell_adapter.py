@@ -1,5 +1,4 @@
 from collections import defaultdict
-import re
 
 def adapt_haskell_components(raw_components):
     nodes = []
@@ -1,90 +1,88 @@
-def adapt_python_components(raw_components, quiet=True):
-    nodes = []
-    edges = []
-
-    def add_node(name, category, extra=None):
-        node = {"id": name, "category": category}
-        if extra:
-            node.update(extra)
-        if name not in seen_nodes:
+from typing import Callable, Optional
+
+
+def _handle_function(comp: dict, add_node: Callable[..., dict], edges: list) -> None:
+    add_node(comp["name"], "function", {
+        "signature": comp.get("parameters", []),
+        "location": {
+            "start": comp["start_line"],
+            "end": comp["end_line"]
+        }
+    })
+
+    calls = comp.get("function_calls", [])
+    for call in calls:
+        add_node(call, "function")
+    edges.extend({"from": comp["name"], "to": call, "relation": "calls"} for call in calls)
+
+    # embed parameters and any inferred variable references
+    for param in comp.get("parameters", []):
+        param_id = f"{comp['name']}::{param}"
+        add_node(param_id, "parameter")
+        edges.append({"from": comp["name"], "to": param_id, "relation": "defines"})
+
+
+def _handle_class(comp: dict, add_node: Callable[..., dict], edges: list) -> None:
+    add_node(comp["name"], "class", {
+        "location": {
+            "start": comp["start_line"],
+            "end": comp["end_line"]
+        }
+    })
+
+    for base in comp.get("base_classes", []):
+        add_node(base, "class")
+        edges.append({"from": comp["name"], "to": base, "relation": "inherits"})
+
+    for method in comp.get("methods", []):
+        method_id = f"{comp['name']}::{method['name']}"
+        add_node(method_id, "method", {
+            "signature": method.get("parameters", []),
+            "location": {
+                "start": method["start_line"],
+                "end": method["end_line"]
+            }
+        })
+
+        edges.append({"from": comp["name"], "to": method_id, "relation": "has_method"})
+
+        calls = method.get("function_calls", [])
+        for call in calls:
+            add_node(call, "function")
+        edges.extend({"from": method_id, "to": call, "relation": "calls"} for call in calls)
+
+        for param in method.get("parameters", []):
+            param_id = f"{method_id}::{param}"
+            add_node(param_id, "parameter")
+            edges.append({"from": method_id, "to": param_id, "relation": "defines"})
+
+
+# component kind -> handler; kinds without an entry (e.g. variables) are skipped
+_DISPATCH = {
+    "function": _handle_function,
+    "class": _handle_class,
+}
+
+
+def adapt_python_components(raw_components: list, quiet: bool = True) -> dict:
+    nodes: list = []
+    edges: list = []
+
+    def add_node(name: str, category: str, extra: Optional[dict] = None) -> dict:
+        node = seen_nodes.get(name)
+        if node is None:
+            node = {"id": name, "category": category}
+            if extra:
+                node.update(extra)
             seen_nodes[name] = node
             nodes.append(node)
         return node
 
-    seen_nodes = {}
+    seen_nodes: dict = {}
 
     for comp in raw_components:
-        if comp["kind"] == "function":
-            fn_node = add_node(comp["name"], "function", {
-                "signature": comp.get("parameters", []),
-                "location": {
-                    "start": comp["start_line"],
-                    "end": comp["end_line"]
-                }
-            })
-
-            for call in comp.get("function_calls", []):
-                add_node(call, "function")
-                edges.append({
-                    "from": comp["name"],
-                    "to": call,
-                    "relation": "calls"
-                })
-
-            # embed parameters and any inferred variable references
-            for param in comp.get("parameters", []):
-                add_node(f"{comp['name']}::{param}", "parameter")
-                edges.append({
-                    "from": comp["name"],
-                    "to": f"{comp['name']}::{param}",
-                    "relation": "defines"
-                })
-
-        elif comp["kind"] == "class":
-            class_node = add_node(comp["name"], "class", {
-                "location": {
-                    "start": comp["start_line"],
-                    "end": comp["end_line"]
-                }
-            })
-
-            for base in comp.get("base_classes", []):
-                add_node(base, "class")
-                edges.append({
-                    "from": comp["name"],
-                    "to": base,
-                    "relation": "inherits"
-                })
-
-            for method in comp.get("methods", []):
-                method_node = add_node(f"{comp['name']}::{method['name']}", "method", {
-                    "signature": method.get("parameters", []),
-                    "location": {
-                        "start": method["start_line"],
-                        "end": method["end_line"]
-                    }
-                })
-
-                edges.append({
-                    "from": comp["name"],
-                    "to": f"{comp['name']}::{method['name']}",
-                    "relation": "has_method"
-                })
-
-                for call in method.get("function_calls", []):
-                    add_node(call, "function")
-                    edges.append({
-                        "from": f"{comp['name']}::{method['name']}",
-                        "to": call,
-                        "relation": "calls"
-                    })
-
-                for param in method.get("parameters", []):
-                    add_node(f"{comp['name']}::{method['name']}::{param}", "parameter")
-                    edges.append({
-                        "from": f"{comp['name']}::{method['name']}",
-                        "to": f"{comp['name']}::{method['name']}::{param}",
-                        "relation": "defines"
-                    })
+        handler = _DISPATCH.get(comp["kind"])
+        if handler:
+            handler(comp, add_node, edges)
 
     return {"nodes": nodes, "edges": edges}
@@ -1,4 +1,7 @@
-def extract_id(comp):
+import sys
+
+
+def extract_id(comp: dict) -> str:
     """
     Build a stable ID: "<module>::<name_or_tag>". 
     If comp["module_name"] is present, use it; otherwise fall back to comp["file_name"].
@@ -6,47 +9,44 @@ def extract_id(comp):
     """
     module_part = comp.get("module_name") or comp.get("file_name") or "<anonymous>"
     name_part = comp.get("name") or comp.get("tag_name") or "<unknown>"
-    return f"{module_part}::{name_part}"
+    return sys.intern(f"{module_part}::{name_part}")
 
 
-def adapt_rescript_components(raw_components):
+def adapt_rescript_components(raw_components: list) -> dict:
     """
     A lightweight adapter that only registers top‐level functions, variables, and modules,
     and creates “calls” edges between them.  We skip nested local_variables, literals, jsx, etc.
     """
-    nodes = []
-    edges = []
+    nodes_by_id: dict = {}
+    edges: list = []
 
-    # 1) Precompute all fully‐qualified IDs
-    fq_ids = []
-    comp_by_fq = {}
-    for comp in raw_components:
-        fq = extract_id(comp)
-        fq_ids.append(fq)
-        comp_by_fq[fq] = comp
+    # 1) Precompute all fully‐qualified IDs (parallel to raw_components, reused by every pass)
+    fq_ids: list = [extract_id(comp) for comp in raw_components]
 
     # 2) Build a set of module‐names and a map from module_name to its FQ IDs
-    all_module_names = set()
-    module_to_fq_map = {}
+    all_module_names: set = set()
+    module_to_fq_map: dict = {}
     for fq_id_val in fq_ids:
-        module_name_part = fq_id_val.split("::", 1)[0]
+        module_name_part, _, _ = fq_id_val.partition("::")
+        module_name_part = sys.intern(module_name_part)
         all_module_names.add(module_name_part)
-        if module_name_part not in module_to_fq_map:
-            module_to_fq_map[module_name_part] = []
-        module_to_fq_map[module_name_part].append(fq_id_val)
+        module_to_fq_map.setdefault(module_name_part, []).append(fq_id_val)
     
-    for comp in raw_components:
-        kind = comp.get("kind")
-        if kind not in ("function", "variable", "module"):
-            continue
-
-        fq = extract_id(comp)
-        nodes.append({
+    # 3) Only top-level functions, variables and modules become nodes
+    relevant = [
+        (fq, comp) for fq, comp in zip(fq_ids, raw_components)
+        if comp.get("kind") in ("function", "variable", "module")
+    ]
+    for fq, comp in relevant:
+        kind = comp["kind"]
+        # a shadowed top-level binding keeps its first position but takes the last span,
+        # as the graph builder's repeated add_node did
+        nodes_by_id[fq] = {
             "id":       fq,
             "category": kind,
             "start":    comp.get("start_line", 0),
             "end":      comp.get("end_line", 0)
-        })
+        }
 
         for raw_call in comp.get("function_calls", []):
             if isinstance(raw_call, dict):
@@ -60,43 +60,29 @@ def adapt_rescript_components(raw_components):
             if target_bare in all_module_names:
 
                 for candidate_fq in module_to_fq_map.get(target_bare, []):
-                    edges.append({
-                        "from":     fq,
-                        "to":       candidate_fq,
-                        "relation": "calls"
-                    })
+                    edges.append({"from": fq, "to": candidate_fq, "relation": "calls"})
             else:
-                edges.append({
-                    "from":     fq,
-                    "to":       target_bare,
-                    "relation": "calls"
-                })
+                edges.append({"from": fq, "to": target_bare, "relation": "calls"})
 
-    seen = {n["id"] for n in nodes}
     for e in edges:
         for endpoint in (e["from"], e["to"]):
-            if endpoint not in seen:
+            if endpoint not in nodes_by_id:
                 # Decide a category for stubs
                 cat = "external_reference"
                 if "." in endpoint:
                     cat = "module_function"
                 elif e["relation"] == "calls":
                     cat = "external_function"
-                nodes.append({"id": endpoint, "category": cat})
-                seen.add(endpoint)
+                nodes_by_id[endpoint] = {"id": endpoint, "category": cat}
 
     # 5) “imports_*” edges for every comp’s import_map
-    for comp in raw_components:
-        fq = extract_id(comp)
+    for fq, comp in zip(fq_ids, raw_components):
         for mod_name, import_list in comp.get("import_map", {}).items():
             for import_info in import_list:
                 import_type = import_info.get("type", "unknown")
-                edges.append({
-                    "from":     fq,
-                    "to":       mod_name,
-                    "relation": f"imports_{import_type}"
-                })
+                edges.append({"from": fq, "to": mod_name, "relation": f"imports_{import_type}"})
 
+    nodes = list(nodes_by_id.values())
     print(f"Created {len(nodes)} nodes and {len(edges)} edges (functions/variables/modules only)")
     fn_edges = [e for e in edges if e["relation"] == "calls"]
     print(f"Function‐call edges: {len(fn_edges)}")
@@ -1,16 +1,15 @@
-from collections import defaultdict
+import sys
+from typing import Iterator
 
-def extract_rust_id(comp):
+_ITEM_TYPES = frozenset({'function_item', 'struct_item', 'enum_item', 'trait_item', 'impl_item', 'mod_item'})
+
+def extract_rust_id(comp: dict) -> str:
     name_part = comp.get("name") or "<unnamed>"
-    module_part = None
-    if comp.get("module_name"):
-        module_part = comp.get("module_name")
-    else:
-        module_part = comp.get("module_path") or "<anonymous_module>"
-    last_module_segment = module_part.split('::')[-1]
+    module_part: str = comp.get("module_name") or comp.get("module_path") or "<anonymous_module>"
+    _, _, last_module_segment = module_part.rpartition('::')
     return f"{last_module_segment}::{name_part}"
 
-def build_module_path_for_component(comp, current_module_stack=[]):
+def build_module_path_for_component(comp: dict, current_module_stack: list = []) -> str:
     if comp.get("resolved_module_path"):
         return comp["resolved_module_path"]
     name = comp.get("name", "")
@@ -19,13 +18,41 @@ def build_module_path_for_component(comp, current_module_stack=[]):
     else:
         return name
 
-def adapt_rust_components(raw_components: list, quiet=True) -> dict:
-    nodes = {}
-    edges = []
-    all_components = []
+def _call_targets(comp: dict) -> Iterator[str]:
+    """Yields the resolved target id of every function, method and macro call in comp."""
+    for call in comp.get('function_calls', []):
+        call_name = call.get('name')
+        resolved_module = call.get('module_name')
+        if resolved_module and resolved_module != call_name:
+            target_id = resolved_module
+        else:
+            target_id = call_name
+        if target_id:
+            yield target_id
+    for call in comp.get('method_calls', []):
+        method_name = call.get('method')
+        resolved_module = call.get('module_name')
+        if resolved_module:
+            target_id = resolved_module
+        else:
+            receiver = call.get('receiver', '')
+            target_id = f"{receiver}::{method_name}" if receiver else method_name
+        if target_id:
+            yield target_id
+    for call in comp.get('macro_calls', []):
+        macro_name = call.get('name')
+        resolved_module = call.get('module_name')
+        target_id = resolved_module if resolved_module else macro_name
+        if target_id:
+            yield target_id
+
+def adapt_rust_components(raw_components: list, quiet: bool = True) -> dict:
+    nodes: dict = {}
+    edges: list = []
+    all_components: list = []
     component_queue = list(raw_components)
-    module_stack = []
-    def process_component_tree(comps, current_module_path=[]):
+    module_stack: list = []
+    def process_component_tree(comps: list, current_module_path: list = []) -> None:
         for comp in comps:
             comp_module_path = current_module_path.copy()
             if comp.get('type') == 'mod_item':
@@ -36,11 +63,16 @@ def adapt_rust_components(raw_components: list, quiet=True) -> dict:
                 process_component_tree(children, comp_module_path)
             all_components.append(comp)
     process_component_tree(raw_components)
-    name_to_fq_ids = defaultdict(list)
+    name_to_fq_ids: dict = {}
     for comp in all_components:
         comp_type = comp.get('type')
         name = comp.get('name')
-        if comp_type in {'function_item', 'struct_item', 'enum_item', 'trait_item', 'impl_item', 'mod_item'}:
+        if comp_type in _ITEM_TYPES:
+            # ids, names and paths repeat across nodes, edges and lookups; intern them once
+            if name:
+                name = sys.intern(name)
+            if comp.get('file_path'):
+                comp['file_path'] = sys.intern(comp['file_path'])
             if comp.get('current_module_path'):
                 module_path = "::".join(comp['current_module_path'])
                 if module_path:
@@ -49,12 +81,12 @@ def adapt_rust_components(raw_components: list, quiet=True) -> dict:
                     fq_id = name
             else:
                 fq_id = name
-            comp['fq_id'] = fq_id
+            comp['fq_id'] = sys.intern(fq_id) if fq_id else fq_id
             if name:
-                name_to_fq_ids[name].append(fq_id)
+                name_to_fq_ids.setdefault(name, []).append(comp['fq_id'])
     for comp in all_components:
         comp_type = comp.get('type')
-        if comp_type in {'function_item', 'struct_item', 'enum_item', 'trait_item', 'impl_item', 'mod_item'}:
+        if comp_type in _ITEM_TYPES:
             fq_id = comp.get('fq_id')
             if fq_id:
                 nodes[fq_id] = {
@@ -66,50 +98,9 @@ def adapt_rust_components(raw_components: list, quiet=True) -> dict:
                     "end": comp.get('span', {}).get('end_line', 0)
                 }
         source_id = comp.get('fq_id') or comp.get('name', 'unknown')
-        for call in comp.get('function_calls', []):
-            call_name = call.get('name')
-            resolved_module = call.get('module_name')
-            if resolved_module and resolved_module != call_name:
-                target_id = resolved_module
-            else:
-                target_id = call_name
-            if target_id:
-                edges.append({
-                    "from": source_id,
-                    "to": target_id,
-                    "relation": "calls"
-                })
-        for call in comp.get('method_calls', []):
-            method_name = call.get('method')
-            resolved_module = call.get('module_name')
-            if resolved_module:
-                target_id = resolved_module
-            else:
-                receiver = call.get('receiver', '')
-                target_id = f"{receiver}::{method_name}" if receiver else method_name
-            if target_id:
-                edges.append({
-                    "from": source_id,
-                    "to": target_id,
-                    "relation": "calls"
-                })
-        for call in comp.get('macro_calls', []):
-            macro_name = call.get('name')
-            resolved_module = call.get('module_name')
-            target_id = resolved_module if resolved_module else macro_name
-            if target_id:
-                edges.append({
-                    "from": source_id,
-                    "to": target_id,
-                    "relation": "calls"
-                })
+        edges.extend({"from": source_id, "to": target_id, "relation": "calls"} for target_id in _call_targets(comp))
         if comp_type == 'use_declaration':
-            for import_path in comp.get('imports', []):
-                edges.append({
-                    "from": source_id,
-                    "to": import_path,
-                    "relation": "imports"
-                })
+            edges.extend({"from": source_id, "to": import_path, "relation": "imports"} for import_path in comp.get('imports', []))
         for type_info in comp.get('types_used', []):
             if isinstance(type_info, dict):
                 type_name = type_info.get('name')
@@ -118,17 +109,11 @@ def adapt_rust_components(raw_components: list, quiet=True) -> dict:
             else:
                 target_id = str(type_info)
             if target_id:
-                edges.append({
-                    "from": source_id,
-                    "to": target_id,
-                    "relation": "uses_type"
-                })
-    final_nodes = list(nodes.values())
-    seen_ids = set(nodes.keys())
+                edges.append({"from": source_id, "to": target_id, "relation": "uses_type"})
     for edge in edges:
         for endpoint_key in ("from", "to"):
             endpoint_id = edge[endpoint_key]
-            if endpoint_id not in seen_ids:
+            if endpoint_id not in nodes:
                 category = "external_reference"
                 if "::" in endpoint_id:
                     if edge["relation"] == "calls":
@@ -137,13 +122,13 @@ def adapt_rust_components(raw_components: list, quiet=True) -> dict:
                         category = "external_type"
                     elif edge["relation"] == "imports":
                         category = "external_module"
-                simple_name = endpoint_id.split("::")[-1]
-                final_nodes.append({
+                _, _, simple_name = endpoint_id.rpartition("::")
+                nodes[endpoint_id] = {
                     "id": endpoint_id,
                     "category": category,
                     "name": simple_name
-                })
-                seen_ids.add(endpoint_id)
+                }
+    final_nodes = list(nodes.values())
     if not quiet:
         print(f"Created {len(final_nodes)} nodes and {len(edges)} edges.")
     return {"nodes": final_nodes, "edges": edges}
@@ -1,17 +1,61 @@
+import functools
 import os
 import re
-
-def infer_project_root(components):
-    module_paths = [os.path.abspath(comp["module"]) for comp in components if comp.get("module")]
-    if module_paths:
-        return os.path.commonpath(module_paths)
-    return None
-
-def make_node_id(comp):
-    ROOT_DIR = os.environ.get("ROOT_DIR", "")
+import sys
+from collections import defaultdict
+
+_NAMED_IMPORT_RE = re.compile(r"import\s+{([^}]+)}\s+from\s+['\"](.+)['\"]")
+_DEFAULT_IMPORT_RE = re.compile(r"import\s+([a-zA-Z0-9_$]+)\s+from\s+['\"](.+)['\"]")
+_NAMESPACE_IMPORT_RE = re.compile(r"import\s+\*\s+as\s+([a-zA-Z0-9_$]+)\s+from\s+['\"](.+)['\"]")
+
+# component kinds whose function_calls become "calls" edges
+_CALL_KINDS = frozenset({
+    "function", "method", "variable", "function_call", "arrow_function",
+    "generator_function", "generator_function_declaration",
+})
+_OPERATOR_KINDS = frozenset({"typeof", "keyof"})
+_MEMBER_KINDS = frozenset({"method", "field"})
+
+# (node key, component key) copied onto every node when present, in output order;
+# "location" follows these, then the kind-specific fields, then the modifiers
+_NODE_FIELDS = (
+    ("signature", "type_signature"),
+    ("type_parameters", "type_parameters"),
+    ("type_parameters_structured", "type_parameters_structured"),
+    ("utility_type", "utility_type"),
+    ("parameters", "parameters"),
+    ("decorators", "decorators"),
+)
+_KIND_NODE_FIELDS = {
+    "variable": ("value",),
+    "class": ("bases", "implements"),
+    "interface": ("extends",),
+}
+_NODE_MODIFIERS = (
+    "members", "static", "abstract", "readonly", "override", "getter", "setter",
+    "type_param_constraints", "index_signatures",
+)
+
+@functools.lru_cache(maxsize=65536)
+def _resolve_import(module_dir, src):
+    # the same relative import (e.g. "./utils") recurs across statements and files
+    return os.path.normpath(os.path.join(module_dir, src + ".ts")).replace("\\", "/")
+
+@functools.lru_cache(maxsize=65536)
+def _combine(caller_dir, target_file):
+    # relative callees resolve against the caller's directory; many call sites share both
+    return os.path.normpath(os.path.join(caller_dir, target_file)).replace("\\", "/")
+
+def make_node_id(comp, current_file=None):
+    """
+    current_file is the fallback module for components without a file_path.
+    adapt_typescript_components reads it from the environment once and passes
+    it in; other callers can omit it to read CURRENT_FILE on each call.
+    """
     module = comp.get("file_path")
     # print("siraj module:", module)
     # remove the root directory from the module path
+    # ROOT_DIR = os.environ.get("ROOT_DIR", "")
     # if module and ROOT_DIR:
     #     module = os.path.relpath(module, ROOT_DIR).replace("\\", "/")
     # last_dir = os.path.basename(ROOT_DIR)
@@ -20,209 +64,282 @@ def make_node_id(comp):
     #     module = module[index:]
 
     if not module:
-        module = os.environ.get("CURRENT_FILE", "unknown")
-
-    if comp.get("kind") in ("method", "field") and comp.get("class") and comp.get("name"):
-        return f"{module}::{comp['class']}::{comp['name']}"     # +"siraj_node101"
-    if comp.get("kind") == "namespace" and comp.get("name"):
-        return f"{module}::{comp['name']}" # only one node for namespace in xyne repo (i.e Google)
-    if comp.get("name"):
-        return f"{module}::{comp['name']}"    #+"siraj_node303"
-    if comp.get("id"):
-        return comp["id"]  # +"siraj_node404"
+        module = current_file if current_file is not None else os.environ.get("CURRENT_FILE", "unknown")
+
+    g = comp.get
+    return _node_id(module, g("kind"), g("class"), g("name"), g("id"))
+
+def _node_id(module, kind, cls, name, comp_id):
+    if kind in _MEMBER_KINDS and cls and name:
+        return module + "::" + cls + "::" + name     # +"siraj_node101"
+    if kind == "namespace" and name:
+        return module + "::" + name # only one node for namespace in xyne repo (i.e Google)
+    if name:
+        return module + "::" + name    #+"siraj_node303"
+    if comp_id:
+        return comp_id  # +"siraj_node404"
     return None
 
-def adapt_typescript_components(raw_components):
-    nodes = []
-    edges = []
-
+def adapt_typescript_components(raw_components, resolved_only=False):
+    """
+    With resolved_only=True, edges whose target is not a node built from
+    raw_components (e.g. calls into console or an unparsed package) are dropped.
+    """
+    nodes, edges = iter_typescript_components(raw_components, resolved_only)
+    nodes = list(nodes)
+    return {
+        "nodes": nodes,
+        "edges": list(edges)
+    }
+
+def iter_typescript_components(raw_components, resolved_only=False):
+    """
+    Streaming form of adapt_typescript_components: returns (nodes, edges)
+    generators. Every node id is known before either is consumed, so the two
+    can be read in any order.
+    """
     if raw_components:
         first = raw_components[0]
         os.environ["ROOT_DIR"] = first.get("root_folder", "")
         os.environ["CURRENT_FILE"] = first.get("file_path", "")
 
-    project_root = infer_project_root(raw_components)
+    current_file = os.environ.get("CURRENT_FILE", "unknown")
+
+    # make_node_id is needed by several passes for the same component; compute it once
+    node_id_cache = {}
+
+    def nid(comp):
+        key = id(comp)
+        # components without an id cache None too, so test membership, not the value
+        if key in node_id_cache:
+            return node_id_cache[key]
+        node_id = make_node_id(comp, current_file)
+        if node_id:
+            # ids are hashed again by every set/dict lookup in the passes below
+            node_id = sys.intern(node_id)
+        node_id_cache[key] = node_id
+        return node_id
+
     import_map = {}
 
-    # 1. Build import map
+    # Bucket components by kind in a single scan so each relation pass below only
+    # walks the components it cares about. Callers (with calls) and typeof/keyof
+    # operators (with deps) span several kinds, so they get their own lists (kept
+    # in source order). The same scan settles which components emit a node and
+    # collects every node id, so edges never wait on the node generator.
+    buckets = defaultdict(list)
+    callers = []
+    op_comps = []
+    node_comps = []  # components that emit a node, in source order
+    node_ids = set()
+    utility_aliases = []  # type aliases that emit a node and carry a utility_type
     for comp in raw_components:
-        if comp.get("kind") == "import":
-            module = comp["module"]
-            stmt = comp["code"]
-            module_dir = os.path.dirname(module)
+        kind = comp.get("kind")
+        buckets[kind].append(comp)
+        if kind in _CALL_KINDS and comp.get("function_calls"):
+            callers.append(comp)
+        op = comp.get("operator")
+        if op in _OPERATOR_KINDS and comp.get("deps"):
+            op_comps.append(comp)
+
+        node_id = nid(comp)
+        if not node_id or node_id in node_ids:
+            continue
+        node_comps.append(comp)
+        node_ids.add(node_id)
+        if op in _OPERATOR_KINDS and comp.get("id"):
+            node_ids.add(comp["id"])
+        if kind == "type_alias" and comp.get("utility_type"):
+            utility_aliases.append(comp)
+            ut = comp["utility_type"]
+            node_ids.add("utility::" + ut["utility_type"])
+            prefix = comp["module"] + "::"
+            node_ids.update(prefix + arg if "::" not in arg else arg for arg in ut["args"])
 
-            if module not in import_map:
-                import_map[module] = {}
+    # 1. Build import map
+    module_dirs = {}
+    for comp in buckets["import"]:
+        module = comp["module"]
+        stmt = comp["code"]
+
+        if module not in import_map:
+            import_map[module] = {}
+            module_dirs[module] = os.path.dirname(module)
+        module_dir = module_dirs[module]
+
+        # Each pattern needs a specific character right after "import": "{" for
+        # named, "*" for namespace, an identifier for default. Peek at it and try
+        # only the one regex that can match.
+        if not stmt.startswith("import"):
+            continue
+        head = stmt[6:].lstrip()[:1]
+        module_imports = import_map[module]
 
-            # Named imports
-            m = re.match(r"import\s+{([^}]+)}\s+from\s+['\"](.+)['\"]", stmt)
+        if head == "{":
+            m = _NAMED_IMPORT_RE.match(stmt)
             if m:
                 names, src = m.groups()
-                src_path = os.path.normpath(os.path.join(module_dir, src + ".ts")).replace("\\", "/")
+                src_path = _resolve_import(module_dir, src)
                 for name in names.split(","):
                     name = name.strip()
                     if " as " in name:
                         orig, alias = [n.strip() for n in name.split(" as ")]
-                        import_map[module][alias] = (src_path, orig)
+                        module_imports[alias] = (src_path, orig)
                     else:
-                        import_map[module][name] = (src_path, name)
-                continue
-
-            # Default import
-            m = re.match(r"import\s+([a-zA-Z0-9_$]+)\s+from\s+['\"](.+)['\"]", stmt)
-            if m:
-                name, src = m.groups()
-                src_path = os.path.normpath(os.path.join(module_dir, src + ".ts")).replace("\\", "/")
-                import_map[module][name] = (src_path, "default")
-                continue
-
-            # Namespace
-            m = re.match(r"import\s+\*\s+as\s+([a-zA-Z0-9_$]+)\s+from\s+['\"](.+)['\"]", stmt)
+                        module_imports[name] = (src_path, name)
+        elif head == "*":
+            m = _NAMESPACE_IMPORT_RE.match(stmt)
             if m:
                 ns, src = m.groups()
-                src_path = os.path.normpath(os.path.join(module_dir, src + ".ts")).replace("\\", "/")
-                import_map[module][ns] = (src_path, "*")
-    existing_nodes = set()
+                src_path = _resolve_import(module_dir, src)
+                module_imports[ns] = (src_path, "*")
+        else:
+            m = _DEFAULT_IMPORT_RE.match(stmt)
+            if m:
+                name, src = m.groups()
+                src_path = _resolve_import(module_dir, src)
+                module_imports[name] = (src_path, "default")
 
-    for comp in raw_components:
-        kind = comp.get("kind")
-        node_id = make_node_id(comp)
+    nodes = _iter_nodes(node_comps, nid)
+    edges = _iter_edges(buckets, callers, op_comps, nid, node_ids, utility_aliases, resolved_only)
+    return nodes, edges
 
-        if not node_id or node_id in existing_nodes:
-            continue
+def _iter_nodes(node_comps, nid):
+    # ids already yielded; typeof/keyof and utility nodes may repeat across components
+    emitted = set()
+    for comp in node_comps:
+        g = comp.get
+        kind = g("kind")
+        node_id = nid(comp)
 
         category = kind if kind != "namespace" else "namespace"
 
-        node = {
-            "id": node_id,
-            "category": category,
-            "signature": comp.get("type_signature"),
-            "type_parameters": comp.get("type_parameters"),
-            "type_parameters_structured": comp.get("type_parameters_structured"),
-            "utility_type": comp.get("utility_type"),
-            "parameters": comp.get("parameters"),
-            "decorators": comp.get("decorators"),
-            "location": {
-                "start": comp.get("start_line"),
-                "end": comp.get("end_line"),
-                "module": comp.get("module"),
-            },
-            "value": comp.get("value") if kind == "variable" else None,
-            "bases": comp.get("bases") if kind == "class" else None,
-            "implements": comp.get("implements") if kind == "class" else None,
-            "extends": comp.get("extends") if kind == "interface" else None,
-            "members": comp.get("members"),
-            "static": comp.get("static"),
-            "abstract": comp.get("abstract"),
-            "readonly": comp.get("readonly"),
-            "override": comp.get("override"),
-            "getter": comp.get("getter"),
-            "setter": comp.get("setter"),
-            "type_param_constraints": comp.get("type_param_constraints"),
-            "index_signatures": comp.get("index_signatures"),
+        node = {"id": node_id}
+        if category is not None:
+            node["category"] = category
+        for key, src in _NODE_FIELDS:
+            value = g(src)
+            if value is not None:
+                node[key] = value
+        module = g("module")
+        node["location"] = {
+            "start": g("start_line"),
+            "end": g("end_line"),
+            # json.load gives every component its own copy of the file path; share one
+            "module": sys.intern(module) if module else module,
         }
-
-        node = {k: v for k, v in node.items() if v is not None}
-        nodes.append(node)
-        existing_nodes.add(node_id)
-        if comp.get("operator") in {"typeof", "keyof"} and comp.get("id"):
+        for key in _KIND_NODE_FIELDS.get(kind, ()):
+            value = g(key)
+            if value is not None:
+                node[key] = value
+        for key in _NODE_MODIFIERS:
+            value = g(key)
+            if value is not None:
+                node[key] = value
+        emitted.add(node_id)
+        yield node
+        op = g("operator")
+        if op in _OPERATOR_KINDS and g("id"):
             node_id = comp["id"]
-            op = comp["operator"]
-            if node_id not in existing_nodes:
-                nodes.append({
+            if node_id not in emitted:
+                node = {
                     "id": node_id,
                     "category": op,
-                    "label": f"{op} {comp.get('target')}",
-                    "target": comp.get("target"),
-                    "deps": comp.get("deps"),
-                    "ast_type": comp.get("ast_type"),
-                })
-                existing_nodes.add(node_id)
-
-        if kind == "type_alias" and comp.get("utility_type"):
-            alias_id = make_node_id(comp)
+                    "label": f"{op} {g('target')}",
+                    "target": g("target"),
+                    "deps": g("deps"),
+                    "ast_type": g("ast_type"),
+                }
+                emitted.add(node_id)
+                yield node
+
+        if kind == "type_alias" and g("utility_type"):
             ut = comp["utility_type"]
-            utility_node_id = f"utility::{ut['utility_type']}"
+            utility_node_id = "utility::" + ut["utility_type"]
 
-            if utility_node_id not in existing_nodes:
-                nodes.append({
+            if utility_node_id not in emitted:
+                node = {
                     "id": utility_node_id,
                     "category": "utility_type",
                     "utility_type": ut["utility_type"]
-                })
-                existing_nodes.add(utility_node_id)
-
-            edges.append({
-                "from": alias_id,
-                "to": utility_node_id,
-                "relation": "utility_type"
-            })
+                }
+                emitted.add(utility_node_id)
+                yield node
 
+            prefix = comp["module"] + "::"
             for arg in ut["args"]:
-                arg_id = f"{comp['module']}::{arg}" if "::" not in arg else arg
-                if arg_id not in existing_nodes:
-                    nodes.append({
+                arg_id = prefix + arg if "::" not in arg else arg
+                if arg_id not in emitted:
+                    node = {
                         "id": arg_id,
                         "category": "type"
-                    })
-                    existing_nodes.add(arg_id)
-                edges.append({
-                    "from": utility_node_id,
-                    "to": arg_id,
-                    "relation": "utility_argument"
-                })
-
-
-    for comp in raw_components:
-        if comp.get("kind") == "class" and comp.get("bases"):
-            from_id = make_node_id(comp)
-            for base in comp["bases"]:
-                to_id = f"{comp['module']}::{base}"
-                edges.append({
-                    "from": from_id,
-                    "to": to_id,
-                    "relation": "extends"
-                })
-
-
-    for comp in raw_components:
-        if comp.get("kind") == "interface" and comp.get("extends"):
-            from_id = make_node_id(comp)
-            for base in comp["extends"]:
-                to_id = f"{comp['module']}::{base}"
-                edges.append({
-                    "from": from_id,
-                    "to": to_id,
-                    "relation": "extends"
-                })
-
-
-    for comp in raw_components:
-        if comp.get("kind") == "class" and comp.get("implements"):
-            from_id = make_node_id(comp)
-            for iface in comp["implements"]:
-                to_id = f"{comp['module']}::{iface}"
-                edges.append({
-                    "from": from_id,
-                    "to": to_id,
-                    "relation": "implements"
-                })
-
-
-    for comp in raw_components:
-        kind = comp.get("kind")
-        if kind not in {"function", "method", "variable", "function_call", "arrow_function", "generator_function", "generator_function_declaration"}:
+                    }
+                    emitted.add(arg_id)
+                    yield node
+
+def _iter_edges(buckets, callers, op_comps, nid, node_ids, utility_aliases, resolved_only):
+    # the same (from, to, relation) triple can come out of several passes, e.g. a
+    # class listed twice or a callee resolved from more than one call site
+    edge_keys = set()
+
+    def new_edges(from_id, to_ids, relation):
+        for to_id in to_ids:
+            to_id = sys.intern(to_id)
+            if resolved_only and to_id not in node_ids:
+                continue
+            key = (from_id, to_id, relation)
+            if key in edge_keys:
+                continue
+            edge_keys.add(key)
+            yield {
+                "from": from_id,
+                "to": to_id,
+                "relation": relation
+            }
+
+    for comp in utility_aliases:
+        ut = comp["utility_type"]
+        utility_node_id = "utility::" + ut["utility_type"]
+        yield from new_edges(nid(comp), (utility_node_id,), "utility_type")
+        prefix = comp["module"] + "::"
+        arg_ids = [prefix + arg if "::" not in arg else arg for arg in ut["args"]]
+        yield from new_edges(utility_node_id, arg_ids, "utility_argument")
+
+    # classes carry bases and implements, interfaces carry extends; one pass per bucket
+    for comp in buckets["class"]:
+        bases = comp.get("bases")
+        implements = comp.get("implements")
+        if not (bases or implements):
+            continue
+        from_id = nid(comp)
+        if not from_id:
+            continue
+        prefix = comp["module"] + "::"
+        if bases:
+            yield from new_edges(from_id, [prefix + base for base in bases], "extends")
+        if implements:
+            yield from new_edges(from_id, [prefix + iface for iface in implements], "implements")
+
+    for comp in buckets["interface"]:
+        if not comp.get("extends"):
             continue
+        from_id = nid(comp)
+        if not from_id:
+            continue
+        prefix = comp["module"] + "::"
+        yield from new_edges(from_id, [prefix + base for base in comp["extends"]], "extends")
+
 
-        from_id = make_node_id(comp)
-        if not from_id or not comp.get("function_calls"):
+    for comp in callers:
+        from_id = nid(comp)
+        if not from_id:
             continue
 
         # derive caller path from from_id
-        caller_module = from_id.split("::", 1)[0]
+        caller_module = from_id.partition("::")[0]
         caller_dir    = os.path.dirname(caller_module)
 
-        for call in comp.get("function_calls", []):
+        for call in comp["function_calls"]:
             target_id = call.get("resolved_callee")
             if not target_id:
                 continue
@@ -233,7 +350,7 @@ def adapt_typescript_components(raw_components):
             #     alias_suffix = target_id[1:].lstrip("/")
             #     # find all existing nodes ending with that suffix
             #     candidates = [
-            #         nid for nid in existing_nodes
+            #         nid for nid in node_ids
             #         if not nid.startswith("@") and nid.endswith(alias_suffix)
             #     ]
             #     if candidates:
@@ -257,54 +374,31 @@ def adapt_typescript_components(raw_components):
 
             # ——— handle "./" or "../" relative imports ———
             if target_id.startswith("."):
-                parts = target_id.split("::")
-                if len(parts) == 2:
-                    target_file, target_symbol = parts
-                    from_file = caller_module
-                    from_dir  = os.path.dirname(from_file)
-                    combined = os.path.normpath(
-                        os.path.join(from_dir, target_file)
-                    ).replace("\\", "/")
-                    target_id = f"{combined}::{target_symbol}"
+                target_file, sep, target_symbol = target_id.partition("::")
+                # only the plain "file::symbol" form is rewritten
+                if sep and "::" not in target_symbol:
+                    target_id = _combine(caller_dir, target_file) + "::" + target_symbol
 
             # ——— emit the edge for non-alias or resolved-relative cases ———
             if from_id != target_id:
-                edges.append({
-                    "from":     from_id,
-                    "to":       target_id,
-                    "relation": "calls"
-                })
-
+                yield from new_edges(from_id, (target_id,), "calls")
 
 
-    for comp in raw_components:
-        if comp.get("kind") == "type_alias" and comp.get("type_dependencies"):
-            from_id = make_node_id(comp)
-            for dep in comp["type_dependencies"]:
-                to_id = f"{comp['module']}::{dep}"
-                if from_id != to_id:
-                    edges.append({
-                        "from": from_id,
-                        "to": to_id,
-                        "relation": "type_dependency"
-                    })
+    for comp in buckets["type_alias"]:
+        if not comp.get("type_dependencies"):
+            continue
+        from_id = nid(comp)
+        if not from_id:
+            continue
+        prefix = comp["module"] + "::"
+        to_ids = [prefix + dep for dep in comp["type_dependencies"]]
+        yield from new_edges(from_id, [to_id for to_id in to_ids if to_id != from_id], "type_dependency")
 
 
-    for comp in raw_components:
-        if comp.get("operator") in {"typeof", "keyof"} and comp.get("deps"):
-            from_id = comp["id"]
-            for dep in comp["deps"]:
-                
-                to_id = f"{comp['module']}::{dep}" if "::" not in dep else dep
-                if from_id != to_id:
-                    edges.append({
-                        "from": from_id,
-                        "to": to_id,
-                        "relation": "fdeps"
-                    })
-
-    filtered_edges = [e for e in edges if e["from"] and e["to"]]
-    return {
-        "nodes": nodes,
-        "edges": filtered_edges
-    }
\ No newline at end of file
+    for comp in op_comps:
+        from_id = comp["id"]
+        if not from_id:
+            continue
+        prefix = comp["module"] + "::"
+        to_ids = [prefix + dep if "::" not in dep else dep for dep in comp["deps"]]
+        yield from new_edges(from_id, [to_id for to_id in to_ids if to_id != from_id], "fdeps")
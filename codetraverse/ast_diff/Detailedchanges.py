@@ -1,37 +1,53 @@
-from collections import defaultdict
+from collections import Counter
+from functools import lru_cache
+
+
+@lru_cache(maxsize=None)
+def _change_key(category: str, change_type: str) -> str:
+    """("functions", "added") -> "addedFunctions"; the category/type vocabulary is tiny."""
+    return change_type + category[0].upper() + category[1:]
 
-from collections import defaultdict
 
 class DetailedChanges:
     """A generic data class to hold the results of a diff operation for any language."""
+    __slots__ = ("moduleName", "changes")
 
     def __init__(self, module_name: str):
         self.moduleName = module_name
-        self.changes = defaultdict(lambda: defaultdict(list))  # {category: {change_type: [items]}}
+        self.changes = {}  # {(category, change_type): [items]}
 
     def add_change(self, category: str, change_type: str, data: tuple):
         """Adds a change to the appropriate category and type."""
-        self.changes[category][change_type].append(data)
+        self.add_changes(category, change_type, [data])
+
+    def add_changes(self, category: str, change_type: str, items: list):
+        """Adds a batch of changes of one category and type; no-op for an empty batch."""
+        if not items:
+            return
+        key = (category, change_type)
+        entries = self.changes.get(key)
+        if entries is None:
+            self.changes[key] = list(items)
+        else:
+            entries.extend(items)
 
     def to_dict(self) -> dict:
-        """Flattens the internal structure to keys like addedFunctions, modifiedTypes, etc."""
-        output = {"moduleName": self.moduleName}
-
-        for category, change_types in self.changes.items():
-            capitalized = category[0].upper() + category[1:]  # e.g., functions → Functions
-            for change_type, entries in change_types.items():
-                key = f"{change_type}{capitalized}"
-                output[key] = entries
-
-        return output
+        """Converts the changes to flat keys like addedFunctions, modifiedTypes, etc."""
+        result = {"moduleName": self.moduleName}
+        for (category, change_type), entries in self.changes.items():
+            result[_change_key(category, change_type)] = entries
+        return result
 
     def __str__(self) -> str:
         summary = [f"Module: {self.moduleName}"]
-        for category in sorted(self.changes.keys()):
-            changes = self.changes[category]
-            added = len(changes.get('added', []))
-            modified = len(changes.get('modified', []))
-            deleted = len(changes.get('deleted', []))
+        counts = {}
+        for (category, change_type), entries in self.changes.items():
+            counts.setdefault(category, Counter())[change_type] = len(entries)
+        for category in sorted(counts):
+            changes = counts[category]
+            added = changes['added']
+            modified = changes['modified']
+            deleted = changes['deleted']
             if added or modified or deleted:
                 summary.append(f"{category}: +{added} ~{modified} -{deleted}")
         return "\n".join(summary)
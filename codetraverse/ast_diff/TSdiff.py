@@ -53,44 +53,46 @@ class TypeScriptFileDiff(BaseFileDiff):
 
         for child in declarations:
             node_to_process = child
-            
-            if child.type == 'export_statement':
+            # node.type builds a new str on every access; read it once per node
+            node_type = child.type
+
+            if node_type == 'export_statement':
                 if child.named_child_count > 0:
                     declaration_node = child.named_child(child.named_child_count - 1)
                     if declaration_node:
                         node_to_process = declaration_node
-            
-            node_type = node_to_process.type
-            if node_type in node_type_map:
+                        node_type = declaration_node.type
+
+            target_dict = node_type_map.get(node_type)
+            if target_dict is not None:
                 if node_type == 'lexical_declaration':
                     declarator = node_to_process.named_child(0)
-                    if not declarator or 'arrow_function' not in [c.type for c in declarator.children]:
+                    # only the declarator's value can be an arrow function; ask for it directly
+                    value = declarator.child_by_field_name('value') if declarator else None
+                    if value is None or value.type != 'arrow_function':
                         continue 
 
-                name = self.get_decl_name(child)
+                # node_to_process is already unwrapped from any export_statement
+                name = self.get_decl_name(node_to_process)
                 if name:
-                    target_dict = node_type_map[node_type]
-                    target_dict[name] = (child, child.text.decode(errors="ignore"), child.start_point, child.end_point)
+                    text = child.text.decode(errors="ignore")
+                    # the stripped body is what diff_components compares; strip it once here.
+                    # No Node is kept, so the parsed tree can be freed once extraction is done.
+                    target_dict[name] = (text.strip(), text, child.start_point, child.end_point)
 
         return functions, classes, interfaces, types, enums
 
     def diff_components(self, before_map: dict, after_map: dict):
         """Compares two dictionaries of components and returns the diff."""
-        before_names = set(before_map.keys())
-        after_names = set(after_map.keys())
-        added_names = after_names - before_names
-        deleted_names = before_names - after_names
-        common_names = before_names & after_names
-        
-        added = [(n, after_map[n][1], {"start": after_map[n][2], "end": after_map[n][3]}) for n in sorted(added_names)]
-        deleted = [(n, before_map[n][1], {"start": before_map[n][2], "end": before_map[n][3]}) for n in sorted(deleted_names)]
-        modified = []
-        for name in sorted(common_names):
-            _, old_body, _, _ = before_map[name]
-            _, new_body, old_start, old_end = after_map[name]
-            if old_body.strip() != new_body.strip():
-                 modified.append((name, old_body, new_body, {"old_start": old_start, "old_end": old_end}))
-        return {"added": added, "deleted": deleted, "modified": modified}
+        def is_modified(before, after):
+            # the first slot holds the stripped body
+            return before[0] != after[0]
+
+        return self.diff_component_maps(before_map, after_map, is_modified)
+
+    def modified_span(self, before: tuple, after: tuple) -> dict:
+        # TypeScript changes report only the new location, under the old_* keys
+        return {"old_start": after[2], "old_end": after[3]}
 
     def compare_two_files(self, old_file_ast: Node, new_file_ast: Node) -> DetailedChanges:
         """The main method to compare two TypeScript files."""
@@ -127,9 +129,10 @@ class TypeScriptFileDiff(BaseFileDiff):
         }
 
         for category, component_map in category_map.items():
-            for name, data_tuple in component_map.items():
-                # data_tuple is (node, text, start_point, end_point)
-                item = (name, data_tuple[1], {"start": data_tuple[2], "end": data_tuple[3]})
-                self.changes.add_change(category, mode, item)
+            # data_tuple is (stripped_text, text, start_point, end_point)
+            self.changes.add_changes(category, mode, [
+                (name, data_tuple[1], {"start": data_tuple[2], "end": data_tuple[3]})
+                for name, data_tuple in component_map.items()
+            ])
         
         return self.changes
@@ -1,10 +1,15 @@
 
 from abc import abstractmethod, ABC
-from typing import Any, Dict
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from .Detailedchanges import DetailedChanges
 from tree_sitter import Language, Parser, Node
 
 
+def _body_changed(old_body: str, new_body: str) -> bool:
+    # unchanged bodies are the common case; equal strings need no strip copies
+    return old_body != new_body and old_body.strip() != new_body.strip()
+
+
 class BaseFileDiff(ABC):
 
     def __init__(self, module_name: str):
@@ -22,6 +27,37 @@ class BaseFileDiff(ABC):
     def diff_components(self, before_map: dict, after_map: dict) -> Dict[str, Any]:
         pass
 
+    def diff_component_maps(
+        self,
+        before_map: dict,
+        after_map: dict,
+        is_modified: Optional[Callable[[Tuple, Tuple], bool]] = None,
+    ) -> Dict[str, List]:
+        """
+        Shared diff_components walk over two {name: (key, body, start, end)} maps.
+        is_modified(before, after) decides whether a name on both sides changed; by
+        default the bodies are compared ignoring surrounding whitespace.
+        """
+        if is_modified is None:
+            def is_modified(before, after):
+                return _body_changed(before[1], after[1])
+        added, deleted, modified = [], [], []
+        # one sorted walk over every name; each list comes out in name order
+        for name in sorted(before_map.keys() | after_map.keys()):
+            before = before_map.get(name)
+            after = after_map.get(name)
+            if before is None:
+                added.append((name, after[1], {"start": after[2], "end": after[3]}))
+            elif after is None:
+                deleted.append((name, before[1], {"start": before[2], "end": before[3]}))
+            elif is_modified(before, after):
+                modified.append((name, before[1], after[1], self.modified_span(before, after)))
+        return {"added": added, "deleted": deleted, "modified": modified}
+
+    def modified_span(self, before: Tuple, after: Tuple) -> Dict[str, Any]:
+        """Location recorded for a modified component: both the old and the new span."""
+        return {"old_start": before[2], "old_end": before[3], "new_start": after[2], "new_end": after[3]}
+
     @abstractmethod
     def compare_two_files(self, old_ast: Node, new_ast: Node) -> DetailedChanges:
         pass
@@ -1,4 +1,8 @@
 import requests
+from requests.adapters import HTTPAdapter
+
+# with max_workers set, generate_ast_diff fetches files from a thread pool; let every worker keep a connection
+POOL_SIZE = 32
 
 def handle_response(response, function, *args):
     if response.status_code == 200:
@@ -19,6 +23,16 @@ class BitBucket:
         self.auth = auth
         self.headers = headers
 
+        # One pooled session for every call, so requests reuse TCP/TLS connections
+        # instead of handshaking per file.
+        self.session = requests.Session()
+        self.session.auth = auth
+        if headers:
+            self.session.headers.update(headers)
+        adapter = HTTPAdapter(pool_connections=POOL_SIZE, pool_maxsize=POOL_SIZE)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
         self.FILE_CONTENT_URL  = base_url + "/api/latest/projects/{projectKey}/repos/{repositorySlug}/browse/{path}"
         self.GET_PR_URL = base_url + "/api/latest/projects/{projectKey}/repos/{repositorySlug}/pull-requests/{pullRequestId}"
         self.GET_LATEST_COMMIT = base_url + "/api/latest/projects/{projectKey}/repos/{repositorySlug}/commits/{branchName}?limit=1"
@@ -46,7 +60,7 @@ class BitBucket:
 
         final_url = self.DIFF_URL.format(projectKey=self.project_key, repositorySlug=self.repo_slug)
         params = {"to": to_commit, "from": from_commit}
-        response = requests.get(final_url, auth=self.auth, headers=self.headers, params=params)
+        response = self.session.get(final_url, params=params)
         return handle_response(response, discover_files)
 
     def get_changed_files_from_commits_raw(self, from_commit: str, to_commit: str):
@@ -55,12 +69,12 @@ class BitBucket:
                 "to": to_commit,
                 "from": from_commit
             }
-            response = requests.get(final_url, auth = self.auth, headers = self.headers, params=params)
+            response = self.session.get(final_url, params=params)
             return handle_response(response, lambda x: x.text)
 
     def get_pr_bitbucket(self, pr_id: str):
         final_url = self.GET_PR_URL.format(projectKey=self.project_key, repositorySlug=self.repo_slug, pullRequestId=pr_id)
-        response = requests.get(final_url, auth=self.auth, headers=self.headers)
+        response = self.session.get(final_url)
         return handle_response(response, lambda r: r.json())
     
     def get_latest_commit_from_branch(self, branchName: str):
@@ -68,7 +82,7 @@ class BitBucket:
             return response.json().get('id')
         
         final_url = self.GET_LATEST_COMMIT.format(projectKey=self.project_key, repositorySlug=self.repo_slug, branchName=branchName)
-        response = requests.get(final_url, auth=self.auth, headers=self.headers)
+        response = self.session.get(final_url)
         return handle_response(response, handle_commit_response)
 
     def get_pr_id(self, branchName: str): 
@@ -79,7 +93,7 @@ class BitBucket:
                     return (pr['id'], pr['fromRef']['latestCommit'], pr['toRef']['latestCommit'])
         
         final_url = self.GET_PRS.format(projectKey = self.project_key, repositorySlug = self.repo_slug, sourceBranch = branchName)
-        response = requests.get(final_url, auth = self.auth, headers = self.headers)
+        response = self.session.get(final_url)
         return handle_response(response, handle_pr_response)
 
     def get_file_content(self, file_path: str, commit: str = "") -> str:
@@ -89,5 +103,5 @@ class BitBucket:
         
         final_url = self.FILE_CONTENT_URL.format(projectKey=self.project_key, repositorySlug=self.repo_slug, path=file_path)
         params = {"at": commit, "limit": 10000}
-        response = requests.get(final_url, auth=self.auth, headers=self.headers, params=params)
+        response = self.session.get(final_url, params=params)
         return handle_response(response, handle_file_response)
@@ -1,6 +1,8 @@
 from git import Repo
+from git.compat import safe_decode
 from unidiff import PatchSet
 import os
+import threading
 from typing import Dict, List, Optional, Tuple
 
 class GitWrapper:
@@ -10,14 +12,21 @@ class GitWrapper:
         self.repo = Repo(repo_path)
         if self.repo.bare:
             raise ValueError(f"Repository at {repo_path} is bare or invalid.")
+        # guards the persistent `git cat-file --batch` process, which is not thread-safe
+        self._cat_file_lock = threading.Lock()
 
-    def get_latest_commit_from_branch(self, branch_name: str) -> str:
-        """Fetch remote branch and get latest commit hash"""
+    def __reduce__(self):
+        # Repo handles hold git subprocesses and do not pickle; reopen by path (process pools)
+        return (GitWrapper, (self.repo.working_dir,))
+
+    def get_latest_commit_from_branch(self, branch_name: str, fetch: bool = True) -> str:
+        """Fetch remote branch and get latest commit hash; pass fetch=False if it was just fetched"""
         # Try fetching explicitly to ensure remote is updated
-        try:
-            self.repo.git.fetch("origin", branch_name)
-        except Exception as e:
-            print(f"Warning: Failed to fetch branch '{branch_name}': {e}")
+        if fetch:
+            try:
+                self.repo.git.fetch("origin", branch_name)
+            except Exception as e:
+                print(f"Warning: Failed to fetch branch '{branch_name}': {e}")
 
         # Prefer origin/<branch> if available
         full_ref = f"origin/{branch_name}"
@@ -30,10 +39,16 @@ class GitWrapper:
     def get_common_ancestor(self, branch1: str, branch2: str) -> str:
         """Get the merge-base (common ancestor) of two branches"""
         try:
-            self.repo.git.fetch("origin", branch1)
-            self.repo.git.fetch("origin", branch2)
+            # both refs in one fetch: one connection and negotiation instead of two
+            self.repo.git.fetch("origin", branch1, branch2)
         except Exception as e:
+            # one bad ref fails the whole fetch; retry separately so the other still updates
             print(f"Warning: fetch failed: {e}")
+            for branch in (branch1, branch2):
+                try:
+                    self.repo.git.fetch("origin", branch)
+                except Exception as e:
+                    print(f"Warning: Failed to fetch branch '{branch}': {e}")
 
         ref1 = f"origin/{branch1}"
         ref2 = f"origin/{branch2}"
@@ -41,20 +56,27 @@ class GitWrapper:
 
     def get_changed_files_from_commits(self, to_commit: str, from_commit: str) -> Dict[str, List[str]]:
         """Get categorized list of changed files between two commits"""
-        diff_index = self.repo.commit(from_commit).diff(to_commit, create_patch=False)
+        # Same diff-tree call GitPython's Commit.diff makes, but read as NUL-separated
+        # name-status fields instead of building a Diff object per entry.
+        raw = self.repo.git.diff_tree("-r", "-M", "-z", "--name-status", from_commit, to_commit)
+        fields = raw.split("\0")
         changes = {
             "added": [],
             "deleted": [],
             "modified": []
         }
 
-        for diff in diff_index:
-            if diff.new_file:
-                changes["added"].append(diff.b_path)
-            elif diff.deleted_file:
-                changes["deleted"].append(diff.a_path)
+        i = 0
+        while i + 1 < len(fields):
+            status, path = fields[i][:1], fields[i + 1]
+            if status == "A":
+                changes["added"].append(path)
+            elif status == "D":
+                changes["deleted"].append(path)
             else:
-                changes["modified"].append(diff.a_path)
+                # renames and copies list old and new paths; keep the old one, as before
+                changes["modified"].append(path)
+            i += 3 if status in ("R", "C") else 2
         return changes
 
     def get_changed_files_from_commits_raw(self, from_commit: str, to_commit: str) -> str:
@@ -66,8 +88,10 @@ class GitWrapper:
         added_changes = {}
         removed_changes = {}
 
-        raw_diff = self.repo.git.diff(from_commit, to_commit, unified=0)
-        patch = PatchSet(raw_diff)
+        # parse the diff line by line off git's stdout instead of buffering it into one str
+        proc = self.repo.git.diff(from_commit, to_commit, unified=0, as_process=True)
+        patch = PatchSet(safe_decode(line) for line in proc.stdout)
+        proc.wait()  # raises GitCommandError if git failed, as the buffered call did
 
         for patched_file in patch:
             filename = patched_file.path.split("/")[-1]
@@ -83,6 +107,11 @@ class GitWrapper:
     def get_file_content(self, file_path: str, commit: Optional[str] = "HEAD") -> str:
         """Get the content of a file at a specific commit"""
         try:
-            return self.repo.git.show(f"{commit}:{file_path}")
+            # one long-lived `git cat-file --batch` process serves every lookup,
+            # instead of a `git show` fork per file
+            with self._cat_file_lock:
+                _, _, _, data = self.repo.git.get_object_data(f"{commit}:{file_path}")
+            # decode like `git show` through GitPython: trailing newline dropped
+            return safe_decode(data[:-1] if data.endswith(b"\n") else data)
         except Exception as e:
             raise FileNotFoundError(f"File '{file_path}' not found at commit '{commit}'. Error: {str(e)}")
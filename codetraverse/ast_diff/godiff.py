@@ -3,6 +3,13 @@ from tree_sitter import Language, Parser, Node
 import tree_sitter_go
 from .Detailedchanges import DetailedChanges
 from .basefilediff import BaseFileDiff
+
+GO_LANGUAGE = Language(tree_sitter_go.language())
+# Field ids are fixed for the grammar; child_by_field_id skips the per-call name lookup.
+_NAME_FIELD = GO_LANGUAGE.field_id_for_name('name')
+_RECEIVER_FIELD = GO_LANGUAGE.field_id_for_name('receiver')
+_PATH_FIELD = GO_LANGUAGE.field_id_for_name('path')
+
 class GoFileDiff(BaseFileDiff):
     """Analyzes and compares two Go ASTs for semantic differences."""
     def __init__(self, module_name=""):
@@ -11,12 +18,12 @@ class GoFileDiff(BaseFileDiff):
     def get_decl_name(self, node: Node) -> str:
         """Finds the name of a Go declaration."""
         if node.type == 'method_declaration':
-            receiver = node.child_by_field_name('receiver')
-            name = node.child_by_field_name('name')
+            receiver = node.child_by_field_id(_RECEIVER_FIELD)
+            name = node.child_by_field_id(_NAME_FIELD)
             if receiver and name:
                 return f"{receiver.text.decode('utf8')} {name.text.decode('utf8')}"
         
-        name_node = node.child_by_field_name('name')
+        name_node = node.child_by_field_id(_NAME_FIELD)
         if name_node:
             return name_node.text.decode('utf8')
         return None
@@ -36,16 +43,26 @@ class GoFileDiff(BaseFileDiff):
                     if child.type == 'import_declaration':
                         # CORRECTED LOGIC: Search for all import_spec nodes inside
                         # an import_declaration to handle both single and block imports.
-                        queue = list(child.children)
-                        while queue:
-                            current = queue.pop(0)
-                            if current.type == 'import_spec':
-                                path_node = current.child_by_field_name('path')
+                        # Walked with a TreeCursor; depth counts levels below child.
+                        cursor = child.walk()
+                        depth = 0
+                        descend = True
+                        while True:
+                            if descend and cursor.goto_first_child():
+                                depth += 1
+                            else:
+                                while depth and not cursor.goto_next_sibling():
+                                    cursor.goto_parent()
+                                    depth -= 1
+                                if not depth:
+                                    break
+                            current = cursor.node
+                            descend = current.type != 'import_spec'
+                            if not descend:
+                                path_node = current.child_by_field_id(_PATH_FIELD)
                                 if path_node:
                                     name = path_node.text.decode('utf8')
                                     imports[name] = (current, current.text.decode('utf8'), current.start_point, current.end_point)
-                            else:
-                                queue.extend(current.children)
                     elif child.type == 'type_declaration':
                         for type_spec in child.children:
                             if type_spec.type == 'type_spec':
@@ -54,15 +71,21 @@ class GoFileDiff(BaseFileDiff):
                     elif child.type == 'var_declaration':
                         for var_spec in child.children:
                             if var_spec.type == 'var_spec':
-                                for name_node in var_spec.children_by_field_name('name'):
-                                    name = name_node.text.decode('utf8')
-                                    variables[name] = (var_spec, var_spec.text.decode('utf8'), var_spec.start_point, var_spec.end_point)
+                                name_nodes = var_spec.children_by_field_id(_NAME_FIELD)
+                                if name_nodes:
+                                    # `a, b = 1, 2` names share one spec; decode its text once
+                                    entry = (var_spec, var_spec.text.decode('utf8'), var_spec.start_point, var_spec.end_point)
+                                    for name_node in name_nodes:
+                                        variables[name_node.text.decode('utf8')] = entry
                     elif child.type == 'const_declaration':
                          for const_spec in child.children:
                             if const_spec.type == 'const_spec':
-                                for name_node in const_spec.children_by_field_name('name'):
-                                    name = name_node.text.decode('utf8')
-                                    constants[name] = (const_spec, const_spec.text.decode('utf8'), const_spec.start_point, const_spec.end_point)
+                                name_nodes = const_spec.children_by_field_id(_NAME_FIELD)
+                                if name_nodes:
+                                    # `a, b = 1, 2` names share one spec; decode its text once
+                                    entry = (const_spec, const_spec.text.decode('utf8'), const_spec.start_point, const_spec.end_point)
+                                    for name_node in name_nodes:
+                                        constants[name_node.text.decode('utf8')] = entry
                     else:
                         name = self.get_decl_name(child)
                         if name:
@@ -72,18 +95,7 @@ class GoFileDiff(BaseFileDiff):
 
     def diff_components(self, before_map: dict, after_map: dict):
         """Compares two dictionaries of components and returns the diff."""
-        before_names, after_names = set(before_map.keys()), set(after_map.keys())
-        added_names, deleted_names, common_names = after_names - before_names, before_names - after_names, before_names & after_names
-        
-        added = [(n, after_map[n][1], {"start": after_map[n][2], "end": after_map[n][3]}) for n in sorted(added_names)]
-        deleted = [(n, before_map[n][1], {"start": before_map[n][2], "end": before_map[n][3]}) for n in sorted(deleted_names)]
-        modified = []
-        for name in sorted(common_names):
-            _, old_body, old_start, old_end = before_map[name]
-            _, new_body, new_start, new_end = after_map[name]
-            if old_body.strip() != new_body.strip():
-                 modified.append((name, old_body, new_body, {"old_start": old_start, "old_end": old_end, "new_start": new_start, "new_end": new_end}))
-        return {"added": added, "deleted": deleted, "modified": modified}
+        return self.diff_component_maps(before_map, after_map)
 
     def compare_two_files(self, old_file_ast: Node, new_file_ast: Node) -> DetailedChanges:
         """The main method to compare two Go files."""
@@ -1,4 +1,5 @@
 import json
+from collections import deque
 from tree_sitter import Language, Parser, Node
 import tree_sitter_haskell
 from .Detailedchanges import DetailedChanges
@@ -23,10 +24,11 @@ class HaskellFileDiff(BaseFileDiff):
             return " ".join(instance_head_nodes).strip()
 
         # For other types, find the first variable or constructor
-        queue = list(node.children)
+        # breadth-first, so the shallowest name wins; deque pops from the left in O(1)
+        queue = deque(node.children)
         while queue:
-            current = queue.pop(0)
-            if current.type in ["variable", "constructor"]:
+            current = queue.popleft()
+            if current.type in ("variable", "constructor"):
                 return current.text.decode(errors="ignore")
             if current.is_named:
                 queue.extend(current.children)
@@ -64,21 +66,11 @@ class HaskellFileDiff(BaseFileDiff):
 
     def diff_components(self, before_map: dict, after_map: dict):
         """Compares two dictionaries of components and returns the diff."""
-        before_names = set(before_map.keys())
-        after_names = set(after_map.keys())
-        added_names = after_names - before_names
-        deleted_names = before_names - after_names
-        common_names = before_names & after_names
-        
-        added = [(n, after_map[n][1], {"start": after_map[n][2], "end": after_map[n][3]}) for n in sorted(added_names)]
-        deleted = [(n, before_map[n][1], {"start": before_map[n][2], "end": before_map[n][3]}) for n in sorted(deleted_names)]
-        modified = []
-        for name in sorted(common_names):
-            _, old_body, _, _ = before_map[name]
-            _, new_body, old_start, old_end = after_map[name]
-            if old_body.strip() != new_body.strip():
-                 modified.append((name, old_body, new_body, {"old_start": old_start, "old_end": old_end}))
-        return {"added": added, "deleted": deleted, "modified": modified}
+        return self.diff_component_maps(before_map, after_map)
+
+    def modified_span(self, before: tuple, after: tuple) -> dict:
+        # Haskell changes report only the new location, under the old_* keys
+        return {"old_start": after[2], "old_end": after[3]}
 
     def compare_two_files(self, old_file_ast: Node, new_file_ast: Node) -> DetailedChanges:
         """The main method to compare two Haskell files."""
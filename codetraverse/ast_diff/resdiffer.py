@@ -8,6 +8,7 @@ import hashlib
 import os
 from .Detailedchanges import DetailedChanges
 from .basefilediff import BaseFileDiff
+from .subtree_digest import subtree_digest
 
 def format_rescript_file(file_pth):
     try:
@@ -16,6 +17,19 @@ def format_rescript_file(file_pth):
         pass
 
 
+def _module_prefix(node: Node):
+    first = node.child(0)
+    if first is None:
+        return None
+    text = first.text
+    if text is None:
+        return None
+    try:
+        return text.decode()
+    except UnicodeDecodeError:
+        return None
+
+
 class RescriptFileDiff(BaseFileDiff):
     def __init__(self, module_name=""):
         self.changes = DetailedChanges(module_name)
@@ -30,34 +44,7 @@ class RescriptFileDiff(BaseFileDiff):
                 return child.text.decode(errors="ignore")
         return None
 
-    def deep_equal(self, nodeA: Node, nodeB: Node):
-        if (nodeA is None) != (nodeB is None):
-            return False
-
-        if nodeA is None and nodeB is None:
-            return True
-
-        if nodeA.type != nodeB.type:
-            return False
-
-        childrenA = nodeA.children
-        childrenB = nodeB.children
-
-        if len(childrenA) != len(childrenB):
-            return False
-
-        if len(childrenA) == 0:
-            return nodeA.text == nodeB.text and nodeA.parent.text == nodeB.parent.text
-
-        for childA, childB in zip(childrenA, childrenB):
-            if not self.deep_equal(childA, childB):
-                return False
-
-        return True
-
     def extract_components(self, root: Node):
-        queue = [root]
-        
         functions = {}
         types = {}
         externals = {}
@@ -68,43 +55,50 @@ class RescriptFileDiff(BaseFileDiff):
             "external_declaration": (externals, lambda x: self.get_decl_name(x, None, "value_identifier"))
         }
 
-        while queue:
-            current_node = queue.pop()
-            if current_node.type in node_name_mapper.keys():
-                dct, mapper_function = node_name_mapper[current_node.type]
+        prefix_cache = {}  # grandparent node id -> module name prefix (None if it has none)
+        kind_cache = {}  # kind_id -> node_name_mapper entry (None for other kinds)
+
+        # Pre-order walk over named nodes that stops at each declaration, driven by
+        # a TreeCursor instead of materializing every node's children list.
+        cursor = root.walk()
+        while True:
+            current_node = cursor.node
+            descend = current_node.is_named
+            if descend:
+                # compare the int kind_id; node.type builds a new str on every access
+                kind = current_node.kind_id
+                if kind in kind_cache:
+                    entry = kind_cache[kind]
+                else:
+                    entry = kind_cache[kind] = node_name_mapper.get(current_node.type)
+            if descend and entry is not None:
+                descend = False
+                dct, mapper_function = entry
                 name = mapper_function(current_node)
                 if name:
                     if current_node.parent.type != "source_file":
-                        try:
-                            name = f"{current_node.parent.parent.child(0).text.decode()}::{name}"
-                        except:
-                            pass
+                        # declarations nested in a module share its grandparent; look its name up once
+                        grandparent = current_node.parent.parent
+                        if grandparent is not None:
+                            key = grandparent.id
+                            if key in prefix_cache:
+                                prefix = prefix_cache[key]
+                            else:
+                                prefix = prefix_cache[key] = _module_prefix(grandparent)
+                            if prefix is not None:
+                                name = f"{prefix}::{name}"
                     dct[name] = (current_node, current_node.text.decode(errors="ignore"), current_node.start_point, current_node.end_point)
-            else:
-                for child in reversed(current_node.children):
-                    if child.is_named:
-                        queue.append(child)
-        return functions, types, externals
+            if descend and cursor.goto_first_child():
+                continue
+            while not cursor.goto_next_sibling():
+                if not cursor.goto_parent():
+                    return functions, types, externals
 
     def diff_components(self, before_map: dict, after_map: dict) -> dict:
-        before_names = set(before_map.keys())
-        after_names = set(after_map.keys())
+        def is_modified(before, after):
+            return subtree_digest(before[0]) != subtree_digest(after[0])
 
-        added_names = after_names - before_names
-        deleted_names = before_names - after_names
-        common = before_names & after_names
-
-        added = [(n, after_map[n][1], {"start": after_map[n][2], "end": after_map[n][3]}) for n in sorted(added_names)]
-        deleted = [(n, before_map[n][1], {"start": before_map[n][2], "end": before_map[n][3]}) for n in sorted(deleted_names)]
-
-        modified = []
-        for name in sorted(common):
-            old_ast, old_body, old_start, old_end = before_map[name]
-            new_ast, new_body, new_start, new_end = after_map[name]
-            if not self.deep_equal(old_ast, new_ast):
-                modified.append((name, old_body, new_body, {"old_start": old_start, "old_end": old_end, "new_start": new_start, "new_end": new_end}))
-
-        return {"added": added, "deleted": deleted, "modified": modified}
+        return self.diff_component_maps(before_map, after_map, is_modified)
 
     def compare_two_files(self, old_file_ast, new_file_ast) -> DetailedChanges:
         """The main method to compare two ReScript files."""
@@ -128,17 +122,9 @@ class RescriptFileDiff(BaseFileDiff):
 
     def process_single_file(self, file_ast, mode="deleted"):
         funcs, types, exts = self.extract_components(file_ast.root_node)
-        func_names = set(funcs.keys())
-        type_names = set(types.keys())
-        ext_names = set(exts.keys())
-
-        if mode == "deleted":
-            self.changes.deletedFunctions = [(n, funcs[n][1], {"start": funcs[n][2], "end": funcs[n][3]}) for n in sorted(func_names)]
-            self.changes.deletedTypes = [(n, types[n][1], {"start": types[n][2], "end": types[n][3]}) for n in sorted(type_names)]
-            self.changes.deletedExternals = [(n, exts[n][1], {"start": exts[n][2], "end": exts[n][3]}) for n in sorted(ext_names)]
-        else:
-            self.changes.addedFunctions = [(n, funcs[n][1], {"start": funcs[n][2], "end": funcs[n][3]}) for n in sorted(func_names)]
-            self.changes.addedTypes = [(n, types[n][1], {"start": types[n][2], "end": types[n][3]}) for n in sorted(type_names)]
-            self.changes.addedExternals = [(n, exts[n][1], {"start": exts[n][2], "end": exts[n][3]}) for n in sorted(ext_names)]
-        
+        for category, component_map in (("functions", funcs), ("types", types), ("externals", exts)):
+            self.changes.add_changes(category, mode, [
+                (name, data[1], {"start": data[2], "end": data[3]}) for name, data in sorted(component_map.items())
+            ])
+
         return self.changes
@@ -62,21 +62,7 @@ class RustFileDiff(BaseFileDiff):
 
     def diff_components(self, before_map: dict, after_map: dict):
         """Compares two dictionaries of components and returns the diff."""
-        before_names = set(before_map.keys())
-        after_names = set(after_map.keys())
-        added_names = after_names - before_names
-        deleted_names = before_names - after_names
-        common_names = before_names & after_names
-        
-        added = [(n, after_map[n][1], {"start": after_map[n][2], "end": after_map[n][3]}) for n in sorted(added_names)]
-        deleted = [(n, before_map[n][1], {"start": before_map[n][2], "end": before_map[n][3]}) for n in sorted(deleted_names)]
-        modified = []
-        for name in sorted(common_names):
-            _, old_body, old_start, old_end = before_map[name]
-            _, new_body, new_start, new_end = after_map[name]
-            if old_body.strip() != new_body.strip():
-                 modified.append((name, old_body, new_body, {"old_start": old_start, "old_end": old_end, "new_start": new_start, "new_end": new_end}))
-        return {"added": added, "deleted": deleted, "modified": modified}
+        return self.diff_component_maps(before_map, after_map)
 
     def compare_two_files(self, old_file_ast: Node, new_file_ast: Node) -> DetailedChanges:
         """The main method to compare two Rust files."""
@@ -0,0 +1,57 @@
+import hashlib
+from typing import Dict, List, Optional
+
+from tree_sitter import Node
+
+
+def subtree_digest(node: Node) -> bytes:
+    """
+    Structural digest of a subtree: node types and tree shape, the text of
+    every leaf, and the text of every node that has a leaf child. Walks the subtree iteratively with a TreeCursor, so no child lists or
+    call frames, and hashes the collected parts once at the end.
+    """
+    parts: List[bytes] = []
+    type_names: Dict[int, bytes] = {}  # kind_id -> length-prefixed type name
+    cursor = node.walk()
+    # ancestors of the cursor up to node, and whether each one's text was added yet
+    parents: List[Node] = []
+    parent_fed: List[bool] = []
+    while True:
+        current = cursor.node
+        assert current is not None
+        kind = current.kind_id
+        name = type_names.get(kind)
+        if name is None:
+            encoded = current.type.encode()
+            name = type_names[kind] = b"%d:%s" % (len(encoded), encoded)
+        parts.append(name)
+        count = current.child_count
+        parts.append(b"%d;" % count)
+        if count == 0:
+            _add_text(parts, current)
+            if not parents:
+                # a bare leaf: its parent's text counts too
+                _add_text(parts, current.parent)
+            elif not parent_fed[-1]:
+                _add_text(parts, parents[-1])
+                parent_fed[-1] = True
+        elif cursor.goto_first_child():
+            parents.append(current)
+            parent_fed.append(False)
+            continue
+        while True:
+            if not parents:
+                return hashlib.blake2b(b"".join(parts), digest_size=8).digest()
+            if cursor.goto_next_sibling():
+                break
+            cursor.goto_parent()
+            parents.pop()
+            parent_fed.pop()
+
+
+def _add_text(parts: List[bytes], node: Optional[Node]) -> None:
+    if node is None:
+        return
+    text = node.text or b""
+    parts.append(b"%d:" % len(text))
+    parts.append(text)
@@ -1,6 +1,10 @@
 import os
 import json
+import threading
 import traceback
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import nullcontext
+from functools import partial
 from typing import Dict, List, Optional, Union, Any
 from tree_sitter import Language, Parser, Node
 import tree_sitter_rescript
@@ -77,6 +81,53 @@ class AstDiffOrchestrator:
             return handler['differ_class'](filename)
         return None
     
+# Files are independent, so with max_workers (or use_processes) they are fetched, parsed
+# and diffed on a pool (tree-sitter parses and git/HTTP fetches run outside the GIL);
+# without either they run serially. Parsers are not thread-safe, so every worker thread
+# or process builds its own orchestrator.
+_worker_state = threading.local()
+_process_git_provider = None
+
+
+def _worker_orchestrator() -> AstDiffOrchestrator:
+    orchestrator = getattr(_worker_state, "orchestrator", None)
+    if orchestrator is None:
+        orchestrator = _worker_state.orchestrator = AstDiffOrchestrator()
+    return orchestrator
+
+
+def _diff_file(git_provider, from_commit: str, to_commit: str, task):
+    category, file_path = task
+    worker = _worker_orchestrator()
+    parser = worker.get_parser(file_path)
+    differ = worker.get_differ(file_path)
+
+    if category == "modified":
+        old_content = git_provider.get_file_content(file_path, from_commit)
+        new_content = git_provider.get_file_content(file_path, to_commit)
+        if old_content is None or new_content is None: return None
+        old_ast = parser.parse(old_content.encode())
+        new_ast = parser.parse(new_content.encode())
+        return differ.compare_two_files(old_ast, new_ast)
+    commit = to_commit if category == "added" else from_commit
+    content = git_provider.get_file_content(file_path, commit)
+    if content is None: return None
+    ast = parser.parse(content.encode())
+    return differ.process_single_file(ast, mode=category)
+
+
+def _init_process_worker(git_provider):
+    # ship the provider once per process rather than with every task
+    global _process_git_provider
+    _process_git_provider = git_provider
+
+
+def _diff_file_in_process(from_commit: str, to_commit: str, task) -> Optional[str]:
+    changes = _diff_file(_process_git_provider, from_commit, to_commit, task)
+    # tree-sitter Points do not survive pickling; send the JSON the parent writes anyway
+    return None if changes is None else json.dumps(changes.to_dict())
+
+
 def generate_ast_diff(
     git_provider: Union[BitBucket, GitWrapper],
     output_dir: str = "./",
@@ -86,6 +137,8 @@ def generate_ast_diff(
     to_branch: str = None,
     from_commit: str = None,
     to_commit: str = None,
+    max_workers: Optional[int] = None,
+    use_processes: bool = False,
 ):
     orchestrator = AstDiffOrchestrator()
     try:
@@ -100,8 +153,9 @@ def generate_ast_diff(
                     from_commit = git_provider.get_latest_commit_from_branch(to_branch)
             elif isinstance(git_provider, GitWrapper):
                 if pr_id: raise ValueError("PR IDs only supported for BitBucket.")
-                to_commit = git_provider.get_latest_commit_from_branch(from_branch)
+                # get_common_ancestor fetches both branches, so from_branch needs no second fetch
                 from_commit = git_provider.get_common_ancestor(from_branch, to_branch)
+                to_commit = git_provider.get_latest_commit_from_branch(from_branch, fetch=False)
             else:
                 raise TypeError("Unsupported git_provider object.")
 
@@ -113,29 +167,28 @@ def generate_ast_diff(
 
         print(changed_files)
         # --- 3. Process Files ---
-        for category in ["modified", "added", "deleted"]:
-            for file_path in changed_files.get(category, []):
-                if not orchestrator.is_supported(file_path): continue
-
-                parser = orchestrator.get_parser(file_path)
-                differ = orchestrator.get_differ(file_path)
-
-                if category == "modified":
-                    old_content = git_provider.get_file_content(file_path, from_commit)
-                    new_content = git_provider.get_file_content(file_path, to_commit)
-                    if old_content is None or new_content is None: continue
-                    old_ast = parser.parse(old_content.encode())
-                    new_ast = parser.parse(new_content.encode())
-                    changes = differ.compare_two_files(old_ast, new_ast)
-                else:
-                    commit = to_commit if category == "added" else from_commit
-                    content = git_provider.get_file_content(file_path, commit)
-                    if content is None: continue
-                    ast = parser.parse(content.encode())
-                    changes = differ.process_single_file(ast, mode=category)
-                
-                if changes:
-                    all_changes.append(changes.to_dict())
+        tasks = [
+            (category, file_path)
+            for category in ["modified", "added", "deleted"]
+            for file_path in changed_files.get(category, [])
+            if orchestrator.is_supported(file_path)
+        ]
+        executor = None  # serial unless the caller opts into a pool
+        if use_processes:
+            # Extraction is pure-Python and holds the GIL; processes spread it over cores.
+            executor = ProcessPoolExecutor(max_workers=max_workers, initializer=_init_process_worker, initargs=(git_provider,))
+            diff = partial(_diff_file_in_process, from_commit, to_commit)
+        else:
+            if max_workers:
+                executor = ThreadPoolExecutor(max_workers=max_workers)
+            diff = partial(_diff_file, git_provider, from_commit, to_commit)
+
+        with executor or nullcontext():
+            # map keeps results in task order, so the output matches a serial run
+            results = executor.map(diff, tasks) if executor else map(diff, tasks)
+            for (category, file_path), changes in zip(tasks, results):
+                if changes is None: continue
+                all_changes.append(json.loads(changes) if use_processes else changes.to_dict())
                 if not quiet: print(f"PROCESSED {category.upper()} FILE ({file_path})")
 
         # --- 4. Write Output File ---
@@ -178,6 +231,8 @@ def run_ast_diff_from_config(config: Dict[str, Any]):
             to_branch=config.get("to_branch"),
             from_commit=config.get("from_commit"),
             to_commit=config.get("to_commit"),
+            max_workers=config.get("max_workers"),
+            use_processes=config.get("use_processes", False),
         )
         print("--- AST Diff Generation Finished ---")
 
@@ -10,6 +10,21 @@ def parse_requirements(rel_path):
         lines = f.read().splitlines()
     return [line.strip() for line in lines if line.strip() and not line.startswith("#")]
 
+# Optionally compile the hot adapter and diff loops to C extensions with mypyc.
+# Enable with CODETRAVERSE_USE_MYPYC=1 (requires mypy); the pure-Python
+# modules stay importable with the same API when it is not set.
+MYPYC_MODULES = [
+    "codetraverse/adapters/python_adapter.py",
+    "codetraverse/adapters/rescript_adapter.py",
+    "codetraverse/adapters/rust_adapter.py",
+    "codetraverse/ast_diff/subtree_digest.py",
+]
+
+ext_modules = []
+if os.environ.get("CODETRAVERSE_USE_MYPYC") == "1":
+    from mypyc.build import mypycify
+    ext_modules = mypycify(MYPYC_MODULES)
+
 setup(
     name='codetraverse',
     version='0.1.0',
@@ -33,4 +48,5 @@ setup(
         ],
     },
     include_package_data=True,
+    ext_modules=ext_modules,
 )
@@ -91,3 +91,9 @@ def test_inherits_and_has_method(adapted):
         ("Greeter", "Greeter::greet"),
     }
     assert expected.issubset(hm)
+
+
+def test_output_is_plain_json(adapted):
+    assert all(type(n) is dict for n in adapted["nodes"])
+    assert all(type(e) is dict for e in adapted["edges"])
+    assert json.loads(json.dumps(adapted)) == adapted
@@ -1 +1,26 @@
-# yet to be implemented 
\ No newline at end of file
+import json
+
+from codetraverse.adapters.rescript_adapter import adapt_rescript_components
+
+
+def test_output_is_plain_json():
+    raw = [
+        {"kind": "function", "module_name": "App", "name": "main", "start_line": 1, "end_line": 3,
+         "function_calls": ["Utils", "log"], "import_map": {"Utils": [{"type": "open"}]}},
+        {"kind": "function", "module_name": "Utils", "name": "helper", "start_line": 1, "end_line": 2},
+    ]
+    adapted = adapt_rescript_components(raw)
+    assert all(type(n) is dict for n in adapted["nodes"])
+    assert all(type(e) is dict for e in adapted["edges"])
+    assert json.loads(json.dumps(adapted)) == adapted
+
+
+def test_shadowed_binding_keeps_last_span():
+    raw = [
+        {"kind": "variable", "module_name": "App", "name": "x", "start_line": 1, "end_line": 1},
+        {"kind": "function", "module_name": "App", "name": "f", "start_line": 2, "end_line": 4},
+        {"kind": "variable", "module_name": "App", "name": "x", "start_line": 5, "end_line": 6},
+    ]
+    nodes = adapt_rescript_components(raw)["nodes"]
+    assert [n["id"] for n in nodes] == ["App::x", "App::f"]
+    assert (nodes[0]["start"], nodes[0]["end"]) == (5, 6)
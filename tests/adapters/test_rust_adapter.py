@@ -1 +1,17 @@
-# yet to be implemented 
\ No newline at end of file
+import json
+
+from codetraverse.adapters.rust_adapter import adapt_rust_components
+
+
+def test_output_is_plain_json():
+    raw = [
+        {"type": "mod_item", "name": "util", "file_path": "src/util.rs", "span": {"start_line": 1, "end_line": 9},
+         "children": [{"type": "function_item", "name": "helper", "file_path": "src/util.rs",
+                       "span": {"start_line": 2, "end_line": 4}, "function_calls": [{"name": "println"}],
+                       "types_used": ["String"]}]},
+        {"type": "use_declaration", "name": "use", "imports": ["std::fmt"]},
+    ]
+    adapted = adapt_rust_components(raw, quiet=True)
+    assert all(type(n) is dict for n in adapted["nodes"])
+    assert all(type(e) is dict for e in adapted["edges"])
+    assert json.loads(json.dumps(adapted)) == adapted
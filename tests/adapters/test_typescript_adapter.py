@@ -3,19 +3,23 @@
 import os
 import json
 import pytest
-from codetraverse.adapters.typescript_adapter import adapt_typescript_components
+from codetraverse.adapters.typescript_adapter import adapt_typescript_components, iter_typescript_components
 
 HERE = os.path.dirname(__file__)
 FDEP_DIR = os.path.abspath(os.path.join(HERE, "..", "..", "output", "fdep", "typescript"))
 
 @pytest.fixture(scope="module")
-def adapted():
+def raw_components():
     all_components = []
     for fname in ("index.json", "models.json", "types.json", "utils.json"):
         path = os.path.join(FDEP_DIR, fname)
         with open(path, encoding="utf-8") as f:
             all_components.extend(json.load(f))
-    return adapt_typescript_components(all_components)
+    return all_components
+
+@pytest.fixture(scope="module")
+def adapted(raw_components):
+    return adapt_typescript_components(raw_components)
 
 def test_nodes_and_edges_structure(adapted):
     assert isinstance(adapted, dict)
@@ -57,3 +61,28 @@ def test_linear_chain_edges(adapted):
     assert ("index.ts::func1",  "models.ts::func2")    in calls
     assert ("models.ts::func2", "types.ts::func3")     in calls
     assert ("types.ts::func3",  "types.ts::c.finalMethod") in calls
+
+def test_resolved_only_drops_external_targets(raw_components, adapted):
+    resolved = adapt_typescript_components(raw_components, resolved_only=True)
+    node_ids = {n["id"] for n in resolved["nodes"]}
+    assert resolved["nodes"] == adapted["nodes"]
+    assert all(e["to"] in node_ids for e in resolved["edges"])
+    assert ("index.ts::func1", "models.ts::func2") in {(e["from"], e["to"]) for e in resolved["edges"]}
+    assert len(resolved["edges"]) < len(adapted["edges"])
+
+def test_streaming_matches_adapted(raw_components, adapted):
+    nodes, edges = iter_typescript_components(raw_components)
+    assert list(nodes) == adapted["nodes"]
+    assert list(edges) == adapted["edges"]
+
+def test_streaming_edges_before_nodes(raw_components, adapted):
+    nodes, edges = iter_typescript_components(raw_components)
+    edges = list(edges)
+    assert edges == adapted["edges"]
+    assert list(nodes) == adapted["nodes"]
+    assert any(e["relation"] == "utility_type" for e in edges)
+
+    resolved = adapt_typescript_components(raw_components, resolved_only=True)
+    nodes, edges = iter_typescript_components(raw_components, resolved_only=True)
+    assert list(edges) == resolved["edges"]
+    assert list(nodes) == resolved["nodes"]